@@ -1,3 +1,4 @@
+import functools
 import os
 import yaml
 from pathlib import Path
@@ -7,6 +8,17 @@ ROOT_DIR = Path(__file__).resolve().parent.parent
 CONFIG_DIR = ROOT_DIR / "config"
 DATA_DIR = ROOT_DIR / "data"
 
+# Prefer the libyaml-backed C loader when PyYAML was built with it; parsing is
+# roughly an order of magnitude faster than the pure-Python SafeLoader.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed search config cached per path, keyed by file mtime so edits are
+# picked up but unchanged files are never re-parsed.
+_SEARCH_CONFIG_CACHE: dict = {}
+
+_ENV_LOADED = False
+
+@functools.lru_cache(maxsize=1)
 def get_env_file_path() -> Path:
     """Get the path to the main .env file, allowing for environment variable overrides."""
     override = os.getenv("JOB_ALERT_ENV_FILE")
@@ -14,6 +26,7 @@ def get_env_file_path() -> Path:
         return Path(override).expanduser()
     return ROOT_DIR / ".env"
 
+@functools.lru_cache(maxsize=1)
 def get_search_config_path() -> Path:
     """Get the path to the job search configuration file."""
     override = os.getenv("JOB_ALERT_SEARCH_CONFIG_FILE")
@@ -25,8 +38,15 @@ def get_search_config() -> dict:
     """Load and parse the job search configuration YAML file."""
     config_path = get_search_config_path()
     if config_path.exists():
-        with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        mtime = os.stat(config_path).st_mtime
+        cached = _SEARCH_CONFIG_CACHE.get(config_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        # Read bytes so libyaml does the UTF-8 decoding natively.
+        with open(config_path, "rb") as f:
+            parsed = yaml.load(f, Loader=_YAML_LOADER) or {}
+        _SEARCH_CONFIG_CACHE[config_path] = (mtime, parsed)
+        return parsed
     print(f"[warn] Search config not found at {config_path}. Using built-in defaults.")
     return {}
 
@@ -37,6 +57,7 @@ def get_llm_model() -> str:
         raise ValueError("Missing 'LLM_MODEL' environment variable. Please set it in your .env file.")
     return model
 
+@functools.lru_cache(maxsize=1)
 def get_candidate_profile_path() -> Path:
     """Get the path to the candidate profile Markdown file."""
     override = os.getenv("JOB_ALERT_CANDIDATE_PROFILE_FILE")
@@ -44,13 +65,15 @@ def get_candidate_profile_path() -> Path:
         return Path(override).expanduser()
     return CONFIG_DIR / "candidate_profile.md"
 
+@functools.lru_cache(maxsize=1)
 def get_past_suggestions_path() -> Path:
-    """Get the path to the JSON file storing past job suggestions."""
+    """Get the path to the JSON Lines file storing past job suggestions."""
     override = os.getenv("JOB_ALERT_PAST_SUGGESTIONS_FILE")
     if override:
         return Path(override).expanduser()
-    return DATA_DIR / "past_job_suggestions.json"
+    return DATA_DIR / "past_job_suggestions.jsonl"
 
+@functools.lru_cache(maxsize=1)
 def get_reports_dir() -> Path:
     """Get the directory path where generated job reports should be saved."""
     override = os.getenv("JOB_ALERT_REPORTS_DIR")
@@ -59,8 +82,22 @@ def get_reports_dir() -> Path:
     return ROOT_DIR / "reports"
 
 def load_project_environment() -> None:
-    """Load environment variables from project configuration files."""
+    """Load environment variables from project configuration files. Idempotent."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
     env_path = get_env_file_path()
     if env_path.exists():
         load_dotenv(env_path)
+    _ENV_LOADED = True
 
+def clear_caches() -> None:
+    """Reset all memoized paths and parsed configs (mainly for tests)."""
+    global _ENV_LOADED
+    get_env_file_path.cache_clear()
+    get_search_config_path.cache_clear()
+    get_candidate_profile_path.cache_clear()
+    get_past_suggestions_path.cache_clear()
+    get_reports_dir.cache_clear()
+    _SEARCH_CONFIG_CACHE.clear()
+    _ENV_LOADED = False
@@ -0,0 +1,84 @@
+"""Persistent cache of job detail pages, keyed by refnr.
+
+Detail HTML is effectively immutable for a given refnr over short windows,
+so caching it on disk lets repeated pipeline runs (cron, CI) skip most
+detail HTTP calls entirely. Backed by a small sqlite3 database under the
+data directory; entries also keep the HTTP validators so stale rows can be
+revalidated with a conditional GET instead of a full refetch.
+"""
+
+import os
+import sqlite3
+import sys
+from typing import Optional, Tuple
+
+try:
+    from config import DATA_DIR
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from config import DATA_DIR
+
+_DB_PATH = DATA_DIR / "detail_cache.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS detail_pages (
+    refnr TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    etag TEXT NOT NULL DEFAULT '',
+    last_modified TEXT NOT NULL DEFAULT '',
+    html BLOB NOT NULL
+)
+"""
+
+
+def _connect() -> sqlite3.Connection:
+    os.makedirs(_DB_PATH.parent, exist_ok=True)
+    conn = sqlite3.connect(_DB_PATH)
+    conn.execute(_SCHEMA)
+    return conn
+
+
+def get_entry(refnr: str) -> Optional[Tuple[float, str, str, bytes]]:
+    """Return (fetched_at, etag, last_modified, html) for a refnr, or None.
+
+    The page comes back as raw bytes; extraction downstream works on bytes
+    so no decode happens here.
+    """
+    try:
+        with _connect() as conn:
+            row = conn.execute(
+                "SELECT fetched_at, etag, last_modified, html FROM detail_pages WHERE refnr = ?",
+                (refnr,),
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    fetched_at, etag, last_modified, html = row
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+    return fetched_at, etag, last_modified, html
+
+
+def put(refnr: str, html: bytes, etag: str, last_modified: str, fetched_at: float) -> None:
+    """Insert or replace the cached page for a refnr."""
+    try:
+        with _connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO detail_pages (refnr, fetched_at, etag, last_modified, html) VALUES (?, ?, ?, ?, ?)",
+                (refnr, fetched_at, etag, last_modified, html),
+            )
+    except sqlite3.Error:
+        pass
+
+
+def touch(refnr: str, fetched_at: float) -> None:
+    """Refresh an entry's timestamp after a 304 revalidation."""
+    try:
+        with _connect() as conn:
+            conn.execute(
+                "UPDATE detail_pages SET fetched_at = ? WHERE refnr = ?",
+                (fetched_at, refnr),
+            )
+    except sqlite3.Error:
+        pass
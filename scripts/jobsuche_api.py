@@ -10,66 +10,154 @@ Design goals:
 
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import logging
 import os
 import re
 import shlex
 import sys
+import time
 from datetime import datetime
 from typing import Dict, List, Tuple, Any
-from urllib.error import HTTPError, URLError
 from urllib.parse import quote, urlencode
-from urllib.request import Request, urlopen
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
 
 try:
     from config import get_search_config
+    from jsonutil import json_loads
+    import detail_cache
 except ImportError:
     sys.path.append(os.path.dirname(os.path.abspath(__file__)))
     from config import get_search_config
+    from jsonutil import json_loads
+    import detail_cache
+
+logger = logging.getLogger(__name__)
 
 API_BASE = "https://rest.arbeitsagentur.de/jobboerse/jobsuche-service/pc/v4/jobs"
+
+# Default results per API page; the JOB_ALERT_PAGE_SIZE override is read
+# lazily per search run (not at import), so values provided via the
+# project's .env are honored like every other JOB_ALERT_* override.
+_DEFAULT_PAGE_SIZE = 100
+
+
+def _page_size() -> int:
+    """Results per API page; overridable to match whatever maximum the API allows."""
+    return int(os.getenv("JOB_ALERT_PAGE_SIZE", str(_DEFAULT_PAGE_SIZE)))
 JOB_DETAIL_BASE = "https://www.arbeitsagentur.de/jobsuche/jobdetail/{refnr}"
 API_HEADERS = {
     "X-API-Key": "jobboerse-jobsuche",
     "User-Agent": "job-alert-agent/1.0",
 }
 
+# Shared session with keep-alive so the many requests against the two
+# arbeitsagentur.de hosts reuse pooled TLS connections instead of paying a
+# fresh handshake per call. requests sends Accept-Encoding: gzip by default.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+_SESSION.mount("https://rest.arbeitsagentur.de", _ADAPTER)
+_SESSION.mount("https://www.arbeitsagentur.de", _ADAPTER)
+
+# Connection limits for the async client used by the concurrent fan-outs.
+_ASYNC_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+# Default headers for the async client: keep-alive comes with the pooled
+# client itself. Accept-Encoding is deliberately left to httpx, which
+# advertises exactly the encodings it can decode (brotli only when the
+# brotli extra is installed) - hardcoding "br" here would hand back
+# undecoded bodies on installs without a brotli decoder.
+_ASYNC_HEADERS = {
+    "User-Agent": "job-alert-agent/1.0",
+}
+
+
+def _async_client() -> httpx.AsyncClient:
+    """Build the shared async HTTP client for a single fan-out batch.
+
+    HTTP/2 lets the many detail/page requests multiplex over a handful of
+    connections; if the h2 extra is not installed, httpx raises ImportError
+    and we fall back to pooled HTTP/1.1 keep-alive. Redirects are followed
+    to match the sync requests.Session path - detail URLs do redirect.
+    """
+    try:
+        return httpx.AsyncClient(
+            http2=True,
+            limits=_ASYNC_LIMITS,
+            timeout=30.0,
+            headers=_ASYNC_HEADERS,
+            follow_redirects=True,
+        )
+    except ImportError:
+        return httpx.AsyncClient(
+            limits=_ASYNC_LIMITS,
+            timeout=30.0,
+            headers=_ASYNC_HEADERS,
+            follow_redirects=True,
+        )
+
+
+# Precompiled pattern for the normalize hot path.
+_WS_RE = re.compile(r"\s+")
+
+# Titles/professions matching these are never a fit for a permanent
+# position, so they are pruned before the LLM ever sees them.
+_EXCLUDE_RE = re.compile(
+    r"\b(praktikum|werkstudent|befristet|aushilfe|minijob|ausbildung|trainee)\b",
+    re.IGNORECASE,
+)
+
+# Literal anchors around the Angular state blob in detail pages. Bytes,
+# so detail pages never need a full-body UTF-8 decode: only the extracted
+# JSON payload (a small fraction of the page) is ever decoded.
+_NG_STATE_START = b'<script id="ng-state" type="application/json">'
+_NG_STATE_END = b"</script>"
+
+# Umlaut/eszett substitutions done in a single C-level pass via str.translate.
+_UMLAUT_TABLE = str.maketrans({"\u00e4": "ae", "\u00f6": "oe", "\u00fc": "ue", "\u00df": "ss"})
+
 
 def normalize(text: str) -> str:
     """Normalize text by converting to lowercase and replacing german umlauts/special characters."""
-    text = (text or "").strip().lower()
-    replacements = {
-        "\u00e4": "ae",
-        "\u00f6": "oe",
-        "\u00fc": "ue",
-        "\u00df": "ss",
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
-    return re.sub(r"\s+", " ", text)
+    return _WS_RE.sub(" ", (text or "").strip().lower().translate(_UMLAUT_TABLE))
 
 
 def _fetch_text(
     url: str, headers: Dict[str, str] | None = None, timeout: int = 30
-) -> Tuple[int, str]:
-    """Fetch raw text content from a URL via GET request."""
-    request = Request(url, headers=headers or {})
-    with urlopen(request, timeout=timeout) as response:
-        status_code = getattr(response, "status", response.getcode())
-        body = response.read().decode("utf-8", errors="replace")
-        return status_code, body
+) -> Tuple[int, bytes]:
+    """Fetch the raw body of a URL via GET request on the shared session.
+
+    Returned as bytes: downstream extraction works on bytes directly, so
+    decoding whole pages up front would be wasted work.
+    """
+    response = _SESSION.get(url, headers=headers, timeout=timeout)
+    return response.status_code, response.content
 
 
 def _fetch_json(
     url: str, headers: Dict[str, str] | None = None, timeout: int = 30
 ) -> Dict:
     """Fetch and parse JSON content from a URL via GET request."""
-    _, body = _fetch_text(url, headers=headers, timeout=timeout)
-    return json.loads(body)
+    response = _SESSION.get(url, headers=headers, timeout=timeout)
+    return json_loads(response.content)
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_date(date_str: str) -> str:
-    """Safely parse a date string and return it in ISO format (YYYY-MM-DD), or empty string if invalid."""
+    """Safely parse a date string and return it in ISO format (YYYY-MM-DD), or empty string if invalid.
+
+    The same timestamps recur heavily across result pages, so results are
+    memoized to avoid repeated strptime calls.
+    """
     if not date_str:
         return ""
     try:
@@ -78,7 +166,7 @@ def parse_date(date_str: str) -> str:
         return ""
 
 
-def fetch_jobs_page(
+def _build_page_params(
     what: str,
     where: str,
     radius_km: int,
@@ -90,8 +178,8 @@ def fetch_jobs_page(
     pav: str = "false",
     arbeitgeber: str = "",
     berufsfeld: str = "",
-) -> Tuple[List[Dict], int]:
-    """Query a single page of job alerts from the API given search criteria."""
+) -> Dict[str, str]:
+    """Build the query parameters for a single job search API page."""
     params = {
         "wo": where,
         "umkreis": str(radius_km),
@@ -113,9 +201,13 @@ def fetch_jobs_page(
         params["berufsfeld"] = berufsfeld
     if what:
         params["was"] = what
+    return params
 
-    url = f"{API_BASE}?{urlencode(params)}"
-    payload = _fetch_json(url, headers=API_HEADERS)
+
+def _parse_jobs_payload(
+    payload: Dict, params: Dict[str, str], what: str
+) -> Tuple[List[Dict], int]:
+    """Unpack a job search API response into the job list and total result count."""
     jobs = payload.get("stellenangebote") or []
     max_results = int(payload.get("maxErgebnisse") or len(jobs))
     for job in jobs:
@@ -124,35 +216,109 @@ def fetch_jobs_page(
     return jobs, max_results
 
 
-def get_latest_job_version(existing: Dict, candidate: Dict) -> Dict:
-    """Given two job dictionaries, return the one that has a more recent publication date."""
-    existing_date = parse_date(existing.get("aktuelleVeroeffentlichungsdatum", ""))
-    candidate_date = parse_date(candidate.get("aktuelleVeroeffentlichungsdatum", ""))
-    if candidate_date > existing_date:
-        return candidate
-    return existing
+async def _afetch_jobs_page(
+    client: httpx.AsyncClient, what: str, base_params: Dict[str, str], page: int
+) -> Tuple[List[Dict], int]:
+    """Async twin of fetch_jobs_page, sharing one client across the fan-out.
+
+    The invariant parameters (wo, umkreis, veroeffentlichtseit, size, ...)
+    are built once per search run and passed in; each page request only
+    adds its term and page number instead of rebuilding the whole dict.
+    """
+    params = dict(base_params, page=str(page))
+    if what:
+        params["was"] = what
+    response = await client.get(API_BASE, params=params, headers=API_HEADERS)
+    return _parse_jobs_payload(json_loads(response.content), params, what)
 
 
-def _extract_angular_state(html: str) -> Dict:
-    """Extract and parse the JSON payload from the <script id="ng-state"> tag in an HTML page."""
-    match = re.search(
-        r'<script id="ng-state" type="application/json">(.*?)</script>',
-        html,
-        flags=re.DOTALL,
-    )
-    if not match:
+def fetch_jobs_page(what: str, **kwargs) -> Tuple[List[Dict], int]:
+    """Query a single page of job alerts from the API given search criteria."""
+    params = _build_page_params(what=what, **kwargs)
+    url = f"{API_BASE}?{urlencode(params)}"
+    payload = _fetch_json(url, headers=API_HEADERS)
+    return _parse_jobs_payload(payload, params, what)
+
+
+def _extract_ng_state_payload(html: bytes) -> bytes:
+    """Extract the raw JSON payload from the <script id="ng-state"> tag in an HTML page.
+
+    The anchors are literal byte strings, so two bytes.find calls (C-level
+    substring search) locate the payload without scanning the page with a
+    DOTALL regex or decoding it.
+    """
+    start = html.find(_NG_STATE_START)
+    if start < 0:
+        return b""
+    start += len(_NG_STATE_START)
+    end = html.find(_NG_STATE_END, start)
+    if end < 0:
+        return b""
+    return html[start:end]
+
+
+# The only keys of the (huge) Angular state blob we actually consume.
+_JOBDETAIL_KEYS = (
+    "stellenangebotsBeschreibung",
+    "datumErsteVeroeffentlichung",
+    "aenderungsdatum",
+    "vertragsdauer",
+)
+
+
+def _extract_jobdetail(html: bytes) -> Dict:
+    """Extract the 'jobdetail' fields we need from the Angular state blob.
+
+    With simdjson available, the payload is parsed lazily and only the
+    handful of consumed keys is materialized instead of the whole tree;
+    otherwise this falls back to a full stdlib json.loads.
+    """
+    payload = _extract_ng_state_payload(html)
+    if not payload:
         return {}
-    payload = match.group(1)
+
+    if simdjson is not None:
+        try:
+            # A fresh Parser per call: reusing one would not be thread-safe
+            # under the concurrent detail fetches, and document proxies are
+            # invalidated by the next parse anyway.
+            doc = simdjson.Parser().parse(payload)
+            detail = doc["jobdetail"]
+        except (KeyError, TypeError, ValueError):
+            return {}
+        out: Dict = {}
+        for key in _JOBDETAIL_KEYS:
+            try:
+                out[key] = detail[key]
+            except KeyError:
+                pass
+        try:
+            out["stellenlokationen"] = detail["stellenlokationen"].as_list()
+        except (KeyError, AttributeError):
+            pass
+        return out
+
     try:
-        return json.loads(payload)
-    except json.JSONDecodeError:
+        state = json_loads(payload)
+    except ValueError:
         return {}
+    return state.get("jobdetail") or {}
 
 
-def fetch_job_details(refnr: str) -> Dict:
-    """Fetch and extract detailed context for a specific job offering using its reference number."""
-    detail_url = JOB_DETAIL_BASE.format(refnr=quote(refnr))
-    out = {
+# Details fetched once per process, keyed by refnr. The availability check in
+# cleanup_inactive_jobs and the deep-dive fetch can request the same refnr
+# within one run; the second caller gets the cached dict instead of a second
+# HTTP round-trip. Entries carry the response validators so stale entries can
+# be revalidated with a conditional GET (a 304 skips the body download).
+_DETAIL_CACHE: Dict[str, Dict] = {}
+
+# Age after which a cached detail entry is revalidated against the server.
+DETAIL_MAX_AGE_SECONDS = 6 * 3600
+
+
+def _empty_detail(detail_url: str) -> Dict:
+    """Build the default detail dict returned for every refnr."""
+    return {
         "detail_url": detail_url,
         "detail_http_status": 0,
         "detail_error": "",
@@ -162,15 +328,162 @@ def fetch_job_details(refnr: str) -> Dict:
         "vertragsdauer_detail": "",
         "detail_arbeitsorte": [],
     }
+
+
+def _load_cached_detail(refnr: str, detail_url: str, now: float) -> Dict | None:
+    """Look up a refnr in the in-process cache, then the on-disk page cache.
+
+    Disk hits are parsed and promoted into the in-process cache (stale ones
+    too, so their validators are available for a conditional GET). Returns
+    the detail dict only when the entry is still fresh.
+    """
+    entry = _DETAIL_CACHE.get(refnr)
+    if entry is None:
+        row = detail_cache.get_entry(refnr)
+        if row is not None:
+            fetched_at, etag, last_modified, html = row
+            out = _empty_detail(detail_url)
+            out["detail_http_status"] = 200
+            _fill_detail(out, html)
+            entry = {
+                "detail": out,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": fetched_at,
+            }
+            _DETAIL_CACHE[refnr] = entry
+    if entry is not None and now - entry["fetched_at"] < DETAIL_MAX_AGE_SECONDS:
+        return entry["detail"]
+    return None
+
+
+def _conditional_headers(entry: Dict | None) -> Dict[str, str]:
+    """Build If-None-Match/If-Modified-Since headers from a cached entry."""
+    headers: Dict[str, str] = {}
+    if entry is not None:
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def fetch_job_details(refnr: str) -> Dict:
+    """Fetch and extract detailed context for a specific job offering using its reference number."""
+    now = time.time()
+    detail_url = JOB_DETAIL_BASE.format(refnr=quote(refnr))
+    cached = _load_cached_detail(refnr, detail_url, now)
+    if cached is not None:
+        return cached
+
+    entry = _DETAIL_CACHE.get(refnr)
+    out = _empty_detail(detail_url)
+    headers = _conditional_headers(entry)
+
     try:
-        status_code, html = _fetch_text(detail_url, timeout=30)
-        out["detail_http_status"] = status_code
-    except (HTTPError, URLError) as exc:
+        response = _SESSION.get(detail_url, headers=headers or None, timeout=30)
+    except requests.RequestException as exc:
         out["detail_error"] = str(exc)
         return out
 
-    state = _extract_angular_state(html)
-    detail = state.get("jobdetail") or {}
+    if response.status_code == 304 and entry is not None:
+        # Unchanged on the server - refresh the cache timestamps and reuse.
+        entry["fetched_at"] = now
+        detail_cache.touch(refnr, now)
+        return entry["detail"]
+
+    out["detail_http_status"] = response.status_code
+    _fill_detail(out, response.content)
+    if response.status_code == 200:
+        _store_detail(refnr, out, response.content, response.headers, now)
+    return out
+
+
+async def _afetch_job_details(
+    client: httpx.AsyncClient, refnr: str, semaphore: asyncio.Semaphore
+) -> Dict:
+    """Async twin of fetch_job_details, sharing cache and validators."""
+    now = time.time()
+    detail_url = JOB_DETAIL_BASE.format(refnr=quote(refnr))
+    cached = _load_cached_detail(refnr, detail_url, now)
+    if cached is not None:
+        return cached
+
+    entry = _DETAIL_CACHE.get(refnr)
+    out = _empty_detail(detail_url)
+    headers = _conditional_headers(entry)
+
+    try:
+        async with semaphore:
+            response = await client.get(detail_url, headers=headers or None)
+    except httpx.HTTPError as exc:
+        out["detail_error"] = str(exc)
+        return out
+
+    if response.status_code == 304 and entry is not None:
+        entry["fetched_at"] = now
+        detail_cache.touch(refnr, now)
+        return entry["detail"]
+
+    out["detail_http_status"] = response.status_code
+    _fill_detail(out, response.content)
+    if response.status_code == 200:
+        _store_detail(refnr, out, response.content, response.headers, now)
+    return out
+
+
+def fetch_many_job_details(refnrs: List[str]) -> Dict[str, Dict]:
+    """Fetch details for many refnrs concurrently, returned as a refnr -> detail map."""
+    unique_refnrs = list(dict.fromkeys(r for r in refnrs if r))
+
+    async def _gather() -> List[Dict]:
+        semaphore = asyncio.Semaphore(50)
+        async with _async_client() as client:
+            return await asyncio.gather(
+                *(_afetch_job_details(client, refnr, semaphore) for refnr in unique_refnrs)
+            )
+
+    return dict(zip(unique_refnrs, asyncio.run(_gather())))
+
+
+async def _afetch_job_status(
+    client: httpx.AsyncClient, refnr: str, semaphore: asyncio.Semaphore
+) -> bool:
+    """Check whether a detail page still exists via a HEAD request.
+
+    A removed posting answers 404/410; nothing is downloaded or parsed,
+    so this costs a few hundred bytes instead of the full page. Only
+    those two codes count as gone: transport errors, 405s from a host
+    that rejects HEAD, and transient 5xx all report the job as still
+    active, so a flaky host can never wipe the whole suggestion history
+    in one cleanup run.
+    """
+    detail_url = JOB_DETAIL_BASE.format(refnr=quote(refnr))
+    try:
+        async with semaphore:
+            response = await client.head(detail_url)
+    except httpx.HTTPError:
+        return True
+    return response.status_code not in (404, 410)
+
+
+def fetch_many_job_statuses(refnrs: List[str]) -> Dict[str, bool]:
+    """Check liveness for many refnrs concurrently, returned as a refnr -> bool map."""
+    unique_refnrs = list(dict.fromkeys(r for r in refnrs if r))
+
+    async def _gather() -> List[bool]:
+        semaphore = asyncio.Semaphore(50)
+        async with _async_client() as client:
+            return await asyncio.gather(
+                *(_afetch_job_status(client, refnr, semaphore) for refnr in unique_refnrs)
+            )
+
+    return dict(zip(unique_refnrs, asyncio.run(_gather())))
+
+
+def _fill_detail(out: Dict, html: bytes) -> None:
+    """Populate a detail dict from the ng-state payload of a detail page."""
+    detail = _extract_jobdetail(html)
     out["description_full"] = detail.get("stellenangebotsBeschreibung", "")
     out["published_detail"] = parse_date(detail.get("datumErsteVeroeffentlichung", ""))
     out["modified_detail"] = detail.get("aenderungsdatum", "")
@@ -184,7 +497,27 @@ def fetch_job_details(refnr: str) -> Dict:
         if plz or ort:
             locations.append(f"{plz} {ort}".strip())
     out["detail_arbeitsorte"] = locations
-    return out
+
+
+def _store_detail(
+    refnr: str, out: Dict, html: bytes, response_headers, now: float
+) -> None:
+    """Cache a fetched detail dict (and its page) with the response validators.
+
+    Only 200 responses are stored (callers gate on the status code), so
+    errors - transient or 404 - stay uncached and the next run retries
+    instead of reusing an empty detail dict for the cache lifetime. This
+    is also why _load_cached_detail can report disk hits as status 200.
+    """
+    etag = response_headers.get("ETag", "")
+    last_modified = response_headers.get("Last-Modified", "")
+    _DETAIL_CACHE[refnr] = {
+        "detail": out,
+        "etag": etag,
+        "last_modified": last_modified,
+        "fetched_at": now,
+    }
+    detail_cache.put(refnr, html, etag, last_modified, now)
 
 
 def fetch_all_matching_jobs() -> Dict[str, Any]:
@@ -198,63 +531,121 @@ def fetch_all_matching_jobs() -> Dict[str, Any]:
     radius_km = int(search_config.get("radius_km", 40))
     days = int(search_config.get("days", 1))
 
-    raw_jobs: List[Dict] = []
+    deduped: Dict[str, Dict] = {}
+    raw_result_count = 0
     query_count = 0
 
-    print(
-        f"Executing API search for terms: {terms} around {where} ({radius_km}km) within {days} days..."
+    def _absorb(jobs: List[Dict]) -> None:
+        """Merge a page of jobs into the dedup map, keeping the newest per refnr.
+
+        The publication date is parsed once per job and cached under
+        "_pubdate" so collisions compare cached values instead of
+        re-parsing both sides.
+        """
+        nonlocal raw_result_count
+        raw_result_count += len(jobs)
+        for job in jobs:
+            refnr = (job.get("refnr") or "").strip()
+            if not refnr:
+                continue
+            job["_pubdate"] = parse_date(
+                job.get("aktuelleVeroeffentlichungsdatum", "")
+            )
+            current = deduped.get(refnr)
+            if current is None or job["_pubdate"] > current["_pubdate"]:
+                deduped[refnr] = job
+
+    logger.info(
+        "Executing API search for terms: %s around %s (%skm) within %s days...",
+        terms, where, radius_km, days,
     )
 
-    for term in terms:
-        page = 1
-        total_pages = None
-        while True:
-            try:
-                jobs, max_results = fetch_jobs_page(
-                    what=term,
-                    where=where,
-                    radius_km=radius_km,
-                    days=days,
-                    size=100,
-                    page=page,
-                )
+    # Query parameters shared by every page of every term, built once.
+    page_size = _page_size()
+    base_params = _build_page_params(
+        what="", where=where, radius_km=radius_km, days=days, size=page_size, page=0
+    )
+    del base_params["page"]
+
+    async def _gather_all_pages() -> None:
+        nonlocal query_count
+
+        async with _async_client() as client:
+            # Shared throttle across both passes so the page fan-out never
+            # holds more than 20 in-flight requests against the API.
+            semaphore = asyncio.Semaphore(20)
+
+            async def _fetch_page_safe(term: str, page: int) -> Tuple[List[Dict], int]:
+                """Fetch one result page, swallowing errors so one failure doesn't tank the batch."""
+                try:
+                    async with semaphore:
+                        return await _afetch_jobs_page(client, term, base_params, page)
+                except Exception as exc:
+                    logger.warning(
+                        "query failed term='%s' page=%s: %s", term, page, exc
+                    )
+                    return [], 0
+
+            async def _absorb_page(term: str, page: int) -> Tuple[str, int]:
+                """Fetch one page and fold it into the dedup map immediately.
+
+                Absorbing on arrival keeps peak memory at O(unique jobs)
+                instead of holding every page's raw list until a batched
+                gather returns.
+                """
+                nonlocal query_count
+                jobs, max_results = await _fetch_page_safe(term, page)
                 query_count += 1
-            except Exception as exc:
-                print(
-                    f"[warn] query failed term='{term}' page={page}: {exc}",
-                    file=sys.stderr,
+                _absorb(jobs)
+                return term, max_results
+
+            # First pass: page 1 of every term concurrently, to learn each term's result count.
+            remaining_pages: List[Tuple[str, int]] = []
+            for coro in asyncio.as_completed(
+                [_absorb_page(term, 1) for term in terms]
+            ):
+                term, max_results = await coro
+                if max_results <= page_size:
+                    # Common case: the term fit on its first page.
+                    continue
+                total_pages = -(-max_results // page_size)
+                remaining_pages.extend(
+                    (term, page) for page in range(2, total_pages + 1)
                 )
-                break
-
-            raw_jobs.extend(jobs)
-            if total_pages is None:
-                total_pages = max(1, (max_results + 100 - 1) // 100)
-            if page >= total_pages:
-                break
-            page += 1
-
-    deduped: Dict[str, Dict] = {}
-    for job in raw_jobs:
-        refnr = (job.get("refnr") or "").strip()
-        if not refnr:
-            continue
-        current = deduped.get(refnr)
-        deduped[refnr] = get_latest_job_version(current, job) if current else job
 
-    selected_jobs = list(deduped.values())
+            # Second pass: all remaining pages of all terms, absorbed as they complete.
+            for coro in asyncio.as_completed(
+                [_absorb_page(term, page) for term, page in remaining_pages]
+            ):
+                await coro
+
+    asyncio.run(_gather_all_pages())
+
+    # Lexical prefilter: drop obvious non-permanent roles for free instead
+    # of spending Stage 1 tokens on them.
+    selected_jobs = [
+        job
+        for job in deduped.values()
+        if not _EXCLUDE_RE.search(f"{job.get('titel', '')} {job.get('beruf', '')}")
+    ]
+    excluded_count = len(deduped) - len(selected_jobs)
+    if excluded_count:
+        logger.info("Excluded %d candidates via title prefilter.", excluded_count)
 
     candidates_summary: List[Dict] = []
     for job in selected_jobs:
-        refnr = job.get("refnr", "")
+        # Bind the nested arbeitsort dict once and reuse the publication date
+        # cached during dedup instead of re-parsing it here.
+        arbeitsort = job.get("arbeitsort") or {}
         summary_obj = {
             "titel": job.get("titel", ""),
             "beruf": job.get("beruf", ""),
             "arbeitgeber": job.get("arbeitgeber", ""),
-            "refnr": refnr,
-            "arbeitsort": (job.get("arbeitsort") or {}).get("ort", ""),
-            "region": (job.get("arbeitsort") or {}).get("region", ""),
-            "entfernung_km": (job.get("arbeitsort") or {}).get("entfernung", ""),
-            "published_api": parse_date(job.get("aktuelleVeroeffentlichungsdatum", "")),
+            "refnr": job.get("refnr", ""),
+            "arbeitsort": arbeitsort.get("ort", ""),
+            "region": arbeitsort.get("region", ""),
+            "entfernung_km": arbeitsort.get("entfernung", ""),
+            "published_api": job.get("_pubdate", ""),
             "query_term": job.get("_query_term", ""),
         }
         candidates_summary.append(summary_obj)
@@ -266,11 +657,11 @@ def fetch_all_matching_jobs() -> Dict[str, Any]:
         "source": "jobsuche-api",
         "query_terms": terms,
         "query_count": query_count,
-        "raw_result_count": len(raw_jobs),
+        "raw_result_count": raw_result_count,
         "deduped_count": len(deduped),
         "candidate_count": len(selected_jobs),
         "candidates": candidates_summary,
     }
 
-    print(f"Found {len(selected_jobs)} unique candidates from the API search.")
+    logger.info("Found %d unique candidates from the API search.", len(selected_jobs))
     return out_summary
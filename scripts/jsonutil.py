@@ -0,0 +1,34 @@
+"""JSON encode/decode helpers backed by orjson when available.
+
+orjson is 2-5x faster than the stdlib on both ends and handles non-ASCII
+natively; every module funnels its hot JSON sites through these helpers so
+the fallback to stdlib json stays in one place.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+
+    def json_loads(data):
+        """Parse JSON from str or bytes."""
+        return orjson.loads(data)
+
+    def json_dumps(obj, indent: bool = False) -> str:
+        """Serialize to a JSON string (non-ASCII preserved, optional 2-space indent)."""
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+
+else:
+
+    def json_loads(data):
+        """Parse JSON from str or bytes."""
+        return json.loads(data)
+
+    def json_dumps(obj, indent: bool = False) -> str:
+        """Serialize to a JSON string (non-ASCII preserved, optional 2-space indent)."""
+        return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
@@ -1,5 +1,6 @@
-import json
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Tuple
 from pydantic import BaseModel, Field
 import instructor
@@ -7,10 +8,43 @@ from litellm import completion, completion_cost
 
 try:
     from config import get_llm_model
+    from jsonutil import json_dumps
 except ImportError:
     import os as _os, sys as _sys
     _sys.path.append(_os.path.dirname(_os.path.abspath(__file__)))
     from config import get_llm_model
+    from jsonutil import json_dumps
+
+logger = logging.getLogger(__name__)
+
+
+def _compact_candidate_rows(candidates: List[Dict[str, Any]]) -> List[str]:
+    """Encode Stage 1 candidates as TSV rows: refnr, titel, arbeitgeber, ort.
+
+    Tabular rows carry none of the per-entry key/brace/quote overhead of a
+    JSON dump, and identical (titel, arbeitgeber) pairs - the same posting
+    republished across locations - collapse to their first occurrence, so
+    the Stage 1 prompt shrinks to a fraction of its JSON size.
+    """
+    rows = []
+    seen_postings = set()
+    for c in candidates:
+        posting = (c.get("titel", ""), c.get("arbeitgeber", ""))
+        if posting in seen_postings:
+            continue
+        seen_postings.add(posting)
+        rows.append(
+            f"{c.get('refnr', '')}\t{c.get('titel', '')}"
+            f"\t{c.get('arbeitgeber', '')}\t{c.get('arbeitsort', '')}"
+        )
+    return rows
+
+
+# Candidates per Stage 1 call: large pools are split into chunks of this
+# size and shortlisted concurrently so latency stays roughly flat.
+_STAGE1_CHUNK_SIZE = 50
+
+
 class Stage1Response(BaseModel):
     shortlisted_refnrs: List[str] = Field(
         description="List of all job refnr IDs that could even remotely fit based on the summary"
@@ -34,14 +68,27 @@ def shortlist_relevant_jobs(
     summary_data: Dict[str, Any],
     candidate_profile: str,
     past_suggestions: str,
+    past_refnrs: set = frozenset(),
 ) -> Tuple[List[str], float]:
     """Use the LLM to aggressively shortlist all potentially relevant jobs based on summaries."""
-    stage1_prompt = f"""
+    # Drop jobs we already suggested before building the prompt - no point in
+    # spending tokens on candidates the model is told to exclude anyway.
+    candidates = [
+        c
+        for c in summary_data.get("candidates", [])
+        if c.get("refnr") not in past_refnrs
+    ]
+    rows = _compact_candidate_rows(candidates)
+
+    # Static system message, identical across chunks and across runs while
+    # profile and history are unchanged: providers cache the shared prefix,
+    # so only the per-chunk user message is billed at full rate on warm runs.
+    stage1_system = f"""
     You are a specialized Job Search Agent. Your goal is to shortlist ALL jobs from the latest API fetch that could even remotely fit. ("Wähle alle Jobs aus, die auch nur im Entferntesten passen könnten")
 
-    CRITICAL INSTRUCTION: Err on the side of inclusion! Do NOT be overly strict at this stage. 
-    It is much better to shortlist irrelevant jobs than to miss a potentially good one. 
-    Only exclude jobs that are clearly and completely irrelevant. 
+    CRITICAL INSTRUCTION: Err on the side of inclusion! Do NOT be overly strict at this stage.
+    It is much better to shortlist irrelevant jobs than to miss a potentially good one.
+    Only exclude jobs that are clearly and completely irrelevant.
     If you are in doubt, SHORTLIST IT. We expect you to find AT LEAST 15-20 candidates given a large list.
 
     User Profile & Preferences:
@@ -49,69 +96,102 @@ def shortlist_relevant_jobs(
 
     Past Suggestions (DO NOT select these again):
     {past_suggestions}
+    """
 
-    Available Jobs (Summary):
-    {json.dumps(summary_data.get("candidates", []), ensure_ascii=False)}
+    def _stage1_call(chunk_rows: List[str]) -> Tuple[List[str], float]:
+        """Run one Stage 1 shortlist call over a chunk of candidate rows."""
+        chunk_message = f"""
+    Available Jobs (one per line, tab-separated: refnr, titel, arbeitgeber, arbeitsort):
+    {chr(10).join(chunk_rows)}
 
-    Please analyze the 'titel', 'arbeitgeber', and 'arbeitsort' of the available jobs and aggressively select all refnr IDs that could even remotely fit.
+    Please analyze the titel, arbeitgeber, and arbeitsort columns and aggressively select all refnr IDs that could even remotely fit.
     """
+        for attempt in range(3):
+            try:
+                # Wrap the dummy client with instructor and litellm
+                wrapped_client = instructor.from_litellm(completion)
+                response1, raw_response1 = wrapped_client.chat.completions.create_with_completion(
+                    model=get_llm_model(),
+                    messages=[
+                        {"role": "system", "content": stage1_system},
+                        {"role": "user", "content": chunk_message},
+                    ],
+                    response_model=Stage1Response,
+                )
+                cost = completion_cost(completion_response=raw_response1) or 0.0
+                return response1.shortlisted_refnrs, cost
+            except Exception as e:
+                logger.error("Error in Stage 1 (attempt %d): %s", attempt + 1, e)
+                if attempt == 2:
+                    sys.exit(1)
+
+    chunks = [
+        rows[i : i + _STAGE1_CHUNK_SIZE]
+        for i in range(0, len(rows), _STAGE1_CHUNK_SIZE)
+    ] or [[]]
+    logger.info(
+        "Stage 1: Shortlisting %d candidates in %d chunk(s) using OpenAI...",
+        len(rows),
+        len(chunks),
+    )
 
-    print("Stage 1: Shortlisting all potentially fitting candidates from summary data using OpenAI...")
+    if len(chunks) == 1:
+        results = [_stage1_call(chunks[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(chunks), 4)) as pool:
+            results = list(pool.map(_stage1_call, chunks))
 
-    for attempt in range(3):
-        try:
-            # Wrap the dummy client with instructor and litellm
-            wrapped_client = instructor.from_litellm(completion)
-            response1, raw_response1 = wrapped_client.chat.completions.create_with_completion(
-                model=get_llm_model(),
-                messages=[{"role": "user", "content": stage1_prompt}],
-                response_model=Stage1Response,
-            )
-            cost = completion_cost(completion_response=raw_response1) or 0.0
-            shortlist = response1.shortlisted_refnrs
-            print(f"Stage 1 Shortlisted {len(shortlist)} candidates. Cost: ${cost:.4f}")
-            return shortlist, cost
-        except Exception as e:
-            print(f"Error in Stage 1 (attempt {attempt + 1}): {e}")
-            if attempt == 2:
-                sys.exit(1)
+    # Union across chunks, preserving first-seen order.
+    shortlist = list(
+        dict.fromkeys(refnr for chunk_shortlist, _ in results for refnr in chunk_shortlist)
+    )
+    total_cost = sum(cost for _, cost in results)
+    logger.info("Stage 1 Shortlisted %d candidates. Cost: $%.4f", len(shortlist), total_cost)
+    return shortlist, total_cost
 
 def select_best_matches(
     client, candidate_profile: str, deep_dive_candidates: List[Dict[str, Any]]
 ) -> Tuple[List[Dict[str, Any]], float]:
     """Use the LLM to evaluate full job details and select the absolute best matches."""
-    stage2_prompt = f"""
+    # Static instructions + profile up front, variable job payload in the
+    # user message - same prefix-caching split as Stage 1.
+    stage2_system = f"""
     You are a specialized Job Search Agent. Your goal is to select the most relevant jobs from the shortlisted candidates. You can select fewer or more depending on how many truly excellent matches there are (e.g., 2 to 5 jobs).
 
     User Profile & Preferences:
     {candidate_profile}
-    
+
     CRITICAL INSTRUCTION: Ignore any specific format requests in the user profile above.
+    """
 
+    stage2_message = f"""
     Shortlisted Jobs (Full Details):
-    {json.dumps(deep_dive_candidates, ensure_ascii=False)}
+    {json_dumps(deep_dive_candidates)}
 
-    Read the full descriptions carefully. Select the jobs that best fit the user's criteria. 
+    Read the full descriptions carefully. Select the jobs that best fit the user's criteria.
     Pay special attention to the permanent contract requirement (unbefristet), the location, and the technical/AI direction.
     Provide a compelling reason for each selection explaining why it fits the user perfectly.
     """
 
-    print("Stage 2: Evaluating full descriptions to select the best job matches...")
+    logger.info("Stage 2: Evaluating full descriptions to select the best job matches...")
 
     for attempt in range(3):
         try:
             wrapped_client = instructor.from_litellm(completion)
             response2, raw_response2 = wrapped_client.chat.completions.create_with_completion(
                 model=get_llm_model(),
-                messages=[{"role": "user", "content": stage2_prompt}],
+                messages=[
+                    {"role": "system", "content": stage2_system},
+                    {"role": "user", "content": stage2_message},
+                ],
                 response_model=Stage2Response,
             )
             cost = completion_cost(completion_response=raw_response2) or 0.0
             final_jobs_models = response2.top_jobs
             final_jobs = [j.model_dump() for j in final_jobs_models]
-            print(f"Stage 2 evaluated best matches. Cost: ${cost:.4f}")
+            logger.info("Stage 2 evaluated best matches. Cost: $%.4f", cost)
             return final_jobs, cost
         except Exception as e:
-            print(f"Error in Stage 2 (attempt {attempt + 1}): {e}")
+            logger.error("Error in Stage 2 (attempt %d): %s", attempt + 1, e)
             if attempt == 2:
                 sys.exit(1)
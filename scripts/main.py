@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
+import logging
+import os
 import sys
-import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import List, Dict, Any
 
 from openai import OpenAI
@@ -11,9 +14,10 @@ try:
     from config import load_project_environment, get_reports_dir
     from past_job_suggestions import cleanup_inactive_jobs, save_suggested_jobs
     from llm_agent import shortlist_relevant_jobs, select_best_matches
-    from jobsuche_api import fetch_all_matching_jobs, fetch_job_details
+    from jobsuche_api import fetch_all_matching_jobs, fetch_many_job_details
     from config import get_candidate_profile_path, get_past_suggestions_path
-    from report_generator import generate_html
+    from report_generator import Job, generate_html
+    from jsonutil import json_dumps
 except ImportError:
     # If run from the root directory or otherwise needing sys.path tweaking
     import os
@@ -21,37 +25,61 @@ except ImportError:
     from config import load_project_environment, get_reports_dir, get_candidate_profile_path, get_past_suggestions_path
     from past_job_suggestions import save_suggested_jobs, cleanup_inactive_jobs
     from llm_agent import shortlist_relevant_jobs, select_best_matches
-    from jobsuche_api import fetch_all_matching_jobs, fetch_job_details
-    from report_generator import generate_html
+    from jobsuche_api import fetch_all_matching_jobs, fetch_many_job_details
+    from report_generator import Job, generate_html
+    from jsonutil import json_dumps
 
-def read_profile_context() -> tuple[str, str]:
+logger = logging.getLogger(__name__)
+
+
+def _configure_logging() -> None:
+    """Route pipeline output through logging, configured once per process.
+
+    LOG_LEVEL (e.g. WARNING) silences the per-step progress lines entirely,
+    including their lazy %s formatting cost.
+    """
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(), format="%(message)s"
+    )
+
+
+# Cache of parsed file contents keyed by (mtime, size) so unchanged files
+# skip the open+decode on repeated runs within one process.
+_FILE_CACHE: Dict[Any, tuple] = {}
+
+
+def _read_cached(path, parser=lambda text: text):
+    """Read and parse a file, reusing the cached result while the file is unchanged."""
+    stat = os.stat(path)
+    key = str(path)
+    cached = _FILE_CACHE.get(key)
+    if cached and cached[0] == (stat.st_mtime, stat.st_size):
+        return cached[1]
+    with open(path, "r", encoding="utf-8") as f:
+        parsed = parser(f.read())
+    _FILE_CACHE[key] = ((stat.st_mtime, stat.st_size), parsed)
+    return parsed
+
+
+def read_profile_context() -> tuple[str, str, set]:
     """Read the candidate profile and recently suggested jobs to build the context for the LLM."""
     candidate_profile_path = get_candidate_profile_path()
     try:
-        with open(candidate_profile_path, "r", encoding="utf-8") as f:
-            candidate_profile = f.read()
+        candidate_profile = _read_cached(candidate_profile_path)
     except FileNotFoundError:
         candidate_profile = "Find relevant IT jobs."
 
     past_suggestions_path = get_past_suggestions_path()
-    past_jobs = cleanup_inactive_jobs(str(past_suggestions_path))
-
-    if not past_jobs:
-        past_suggestions = "None"
-    else:
-        # Send company, role, and refnr to save tokens
-        import json
-        streamlined = [
-            {
-                "company": j.get("company"),
-                "role": j.get("role"),
-                "refnr": j.get("refnr"),
-            }
-            for j in past_jobs
-        ]
-        past_suggestions = json.dumps(streamlined, ensure_ascii=False)
+    # Only company, role, and refnr go into the LLM context, so let the
+    # cleanup project the entries down directly instead of re-projecting.
+    past_jobs = cleanup_inactive_jobs(
+        str(past_suggestions_path), projection=("company", "role", "refnr")
+    )
+    past_refnrs = {j.get("refnr") for j in past_jobs if j.get("refnr")}
+
+    past_suggestions = json_dumps(past_jobs) if past_jobs else "None"
 
-    return candidate_profile, past_suggestions
+    return candidate_profile, past_suggestions, past_refnrs
 
 def fetch_deep_dive_details(
     summary_data: Dict[str, Any], shortlist: List[str]
@@ -64,32 +92,32 @@ def fetch_deep_dive_details(
         if job.get("refnr") in shortlist
     ]
 
-    print(
-        f"Fetching full details for {len(jobs_to_fetch)} shortlisted candidates concurrently..."
+    logger.info(
+        "Fetching full details for %d shortlisted candidates concurrently...",
+        len(jobs_to_fetch),
     )
 
-    def _fetch_single_job_details(job: Dict[str, Any]) -> Dict[str, Any]:
+    details = fetch_many_job_details([job.get("refnr") for job in jobs_to_fetch])
+
+    for job in jobs_to_fetch:
         refnr = job.get("refnr")
         ort = job.get("arbeitsort", "")
         if isinstance(ort, dict):
             ort = ort.get("ort", "")
 
-        detail = fetch_job_details(refnr)
+        detail = details.get(refnr, {})
 
-        return {
-            "refnr": refnr,
-            "titel": job.get("titel"),
-            "arbeitgeber": job.get("arbeitgeber"),
-            "arbeitsort": ort,
-            "description_full": detail.get("description_full", ""),
-            "detail_url": detail.get("detail_url", ""),
-            "vertragsdauer_detail": detail.get("vertragsdauer_detail", ""),
-        }
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        results = executor.map(_fetch_single_job_details, jobs_to_fetch)
-        for result in results:
-            deep_dive_candidates.append(result)
+        deep_dive_candidates.append(
+            {
+                "refnr": refnr,
+                "titel": job.get("titel"),
+                "arbeitgeber": job.get("arbeitgeber"),
+                "arbeitsort": ort,
+                "description_full": detail.get("description_full", ""),
+                "detail_url": detail.get("detail_url", ""),
+                "vertragsdauer_detail": detail.get("vertragsdauer_detail", ""),
+            }
+        )
 
     return deep_dive_candidates
 
@@ -103,20 +131,24 @@ def build_and_save_reports(
     report_path = reports_dir / f"job_report_{timestamp}.md"
     html_report_path = reports_dir / f"job_report_{timestamp}.html"
 
-    report_content = "# Job Search Report\n\n"
-    report_content += f"Hier sind die {len(final_jobs)} am besten passenden Jobs, die heute für dein Profil gefunden wurden.\n\n"
+    # Collect markdown chunks and join once instead of growing a string
+    # with repeated concatenation.
+    chunks = [
+        "# Job Search Report\n\n",
+        f"Hier sind die {len(final_jobs)} am besten passenden Jobs, die heute für dein Profil gefunden wurden.\n\n",
+    ]
 
     matches_to_log = []
     for i, job in enumerate(final_jobs, 1):
         # Markdown Part
-        report_content += f"## {i}. {job['title']}\n"
-        report_content += f"**Arbeitgeber:** {job['employer']}\n"
-        report_content += f"**Standort:** {job['location']}\n"
-        report_content += (
+        chunks.append(
+            f"## {i}. {job['title']}\n"
+            f"**Arbeitgeber:** {job['employer']}\n"
+            f"**Standort:** {job['location']}\n"
             f"**Link:** [Stellenanzeige Agentur für Arbeit]({job['detail_url']})\n\n"
+            f"**Warum diese Stelle passt:**\n{job['reason']}\n\n"
+            "---\n\n"
         )
-        report_content += f"**Warum diese Stelle passt:**\n{job['reason']}\n\n"
-        report_content += "---\n\n"
 
         matches_to_log.append(
             {
@@ -126,61 +158,64 @@ def build_and_save_reports(
             }
         )
 
+    chunks.append("\n---\n*Automatisch generiert von Job Alert Agent*\n")
     if total_cost > 0:
-        report_content += f"\n---\n*Automatisch generiert von Job Alert Agent*\n*LLM Kosten für diesen Durchlauf: ${total_cost:.4f}*\n"
-    else:
-        report_content += f"\n---\n*Automatisch generiert von Job Alert Agent*\n"
+        chunks.append(f"*LLM Kosten für diesen Durchlauf: ${total_cost:.4f}*\n")
+    report_content = "".join(chunks)
 
     # HTML Part: utilizing the new report generator module
-    import os
-    from pathlib import Path
-    template_path = Path(os.path.join(os.path.dirname(__file__), "report_template.html"))
-    html_content = generate_html(final_jobs, template_path, total_cost=total_cost)
+    template_path = Path(__file__).with_name("report_template.html")
+    html_jobs = [Job.from_dict(job) for job in final_jobs]
+    html_content = generate_html(html_jobs, template_path, total_cost=total_cost)
 
     os.makedirs(reports_dir, exist_ok=True)
-    with open(report_path, "w", encoding="utf-8") as f:
-        f.write(report_content)
-    with open(html_report_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    report_path.write_text(report_content, encoding="utf-8")
+    html_report_path.write_text(html_content, encoding="utf-8")
 
-    print(f"Generated Markdown report at {report_path}")
-    print(f"Generated temporary HTML report at {html_report_path}")
+    logger.info("Generated Markdown report at %s", report_path)
+    logger.info("Generated temporary HTML report at %s", html_report_path)
 
-    # Log to past_job_suggestions.json
+    # Log to past_job_suggestions.jsonl
     past_suggestions_path = get_past_suggestions_path()
-    print(f"Logging new suggestions to {past_suggestions_path}...")
+    logger.info("Logging new suggestions to %s...", past_suggestions_path)
     save_suggested_jobs(matches_to_log, str(past_suggestions_path))
-    print("Logged new suggestions.")
+    logger.info("Logged new suggestions.")
 
 
 def generate_report():
     """Main pipeline execution: fetch jobs, filter via LLM, and generate the final report."""
+    _configure_logging()
+
     # Load configuration
     load_project_environment()
 
-    # Dynamic search mapped to the externalized file
-    summary_data = fetch_all_matching_jobs()
+    # The API search and the profile/history preparation (which re-verifies
+    # past suggestions over the network) are independent, so overlap them
+    # instead of paying both latencies back to back.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        summary_future = pool.submit(fetch_all_matching_jobs)
+        context_future = pool.submit(read_profile_context)
+        summary_data = summary_future.result()
+        candidate_profile, past_suggestions, past_refnrs = context_future.result()
 
     # 120s timeout for network requests so it doesn't hang indefinitely, but gives large requests time to finish
     client = OpenAI(timeout=120.0)
 
-    candidate_profile, past_suggestions = read_profile_context()
-
     shortlist, cost1 = shortlist_relevant_jobs(
-        client, summary_data, candidate_profile, past_suggestions
+        client, summary_data, candidate_profile, past_suggestions, past_refnrs
     )
     if not shortlist:
-        print("No candidates found in Stage 1.")
+        logger.info("No candidates found in Stage 1.")
         return
 
     deep_dive_candidates = fetch_deep_dive_details(summary_data, shortlist)
     if not deep_dive_candidates:
-        print("No details could be fetched for candidates.")
+        logger.info("No details could be fetched for candidates.")
         return
 
     final_jobs, cost2 = select_best_matches(client, candidate_profile, deep_dive_candidates)
     if not final_jobs:
-        print("No candidates selected in Stage 2.")
+        logger.info("No candidates selected in Stage 2.")
         return
 
     total_cost = cost1 + cost2
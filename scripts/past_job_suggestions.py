@@ -1,69 +1,169 @@
-import json
+import logging
 import os
-import concurrent.futures
+import tempfile
+import time
 from typing import List, Dict, Any
-from jobsuche_api import fetch_job_details
+from config import DATA_DIR
+from jobsuche_api import fetch_many_job_statuses
+from jsonutil import json_loads, json_dumps
 from datetime import datetime
 
-def cleanup_inactive_jobs(file_path: str) -> List[Dict[str, Any]]:
-    """Verify which past job suggestions are still active and remove inactive ones from the local record."""
-    if not os.path.exists(file_path):
-        return []
+logger = logging.getLogger(__name__)
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        try:
-            past_jobs = json.load(f)
-        except json.JSONDecodeError:
-            past_jobs = []
+# Activity checks are cached (in memory and on disk) so refnrs verified
+# recently - including dead ones - are not re-fetched on every invocation.
+_ACTIVITY_TTL_SECONDS = 6 * 3600
+_ACTIVITY_CACHE_FILE = DATA_DIR / "refnr_status_cache.json"
+_activity_cache: Dict[str, tuple] = {}
+_activity_cache_loaded = False
 
-    print(f"Verifying {len(past_jobs)} past suggestions for availability...")
-    active_jobs = []
 
-    def check_job(job):
-        refnr = job.get("refnr")
-        if not refnr:
-            return None
-        detail = fetch_job_details(refnr)
-        if detail.get("description_full"):
-            return job
-        return None
+def _load_activity_cache() -> None:
+    global _activity_cache_loaded
+    if _activity_cache_loaded:
+        return
+    _activity_cache_loaded = True
+    try:
+        with open(_ACTIVITY_CACHE_FILE, "r", encoding="utf-8") as f:
+            raw = json_loads(f.read())
+    except (OSError, ValueError):
+        return
+    now = time.time()
+    for refnr, (checked_at, active) in raw.items():
+        if now - checked_at < _ACTIVITY_TTL_SECONDS:
+            _activity_cache[refnr] = (checked_at, active)
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        results = executor.map(check_job, past_jobs)
-        for result in results:
-            if result:
-                active_jobs.append(result)
 
-    print(f"Kept {len(active_jobs)} active past jobs, removed {len(past_jobs) - len(active_jobs)}.")
+def _save_activity_cache() -> None:
+    try:
+        os.makedirs(_ACTIVITY_CACHE_FILE.parent, exist_ok=True)
+        with open(_ACTIVITY_CACHE_FILE, "w", encoding="utf-8") as f:
+            f.write(json_dumps({k: list(v) for k, v in _activity_cache.items()}))
+    except OSError:
+        pass
 
-    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(active_jobs, f, indent=2, ensure_ascii=False)
 
-    return active_jobs
+def _check_jobs_active(refnrs: List[str]) -> Dict[str, bool]:
+    """Resolve refnrs to liveness flags, fetching uncached ones in one async batch."""
+    now = time.time()
+    active_map: Dict[str, bool] = {}
+    to_fetch = []
+    for refnr in refnrs:
+        cached = _activity_cache.get(refnr)
+        if cached and now - cached[0] < _ACTIVITY_TTL_SECONDS:
+            active_map[refnr] = cached[1]
+        else:
+            to_fetch.append(refnr)
 
-def save_suggested_jobs(matches: List[Dict[str, Any]], file_path: str):
-    """Append new job matches to the historical suggestions record."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    # A HEAD request per refnr answers 200-vs-404 in a few hundred bytes
+    # instead of downloading and parsing each full detail page.
+    for refnr, active in fetch_many_job_statuses(to_fetch).items():
+        _activity_cache[refnr] = (time.time(), active)
+        active_map[refnr] = active
+    return active_map
+
+
+def _load_past_jobs(file_path: str) -> List[Dict[str, Any]]:
+    """Load the past suggestions record (JSON Lines, one entry per line).
 
-    past_jobs = []
+    Falls back to reading a legacy .json list next to the requested path -
+    also when the .jsonl exists but holds no entries yet - so existing
+    histories survive the storage format change.
+    """
+    entries: List[Dict[str, Any]] = []
     if os.path.exists(file_path):
         with open(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json_loads(line))
+                except ValueError:
+                    continue
+    if entries:
+        return entries
+
+    legacy_path = os.path.splitext(file_path)[0] + ".json"
+    if os.path.exists(legacy_path):
+        with open(legacy_path, "r", encoding="utf-8") as f:
             try:
-                past_jobs = json.load(f)
-            except json.JSONDecodeError:
+                return json_loads(f.read()) or []
+            except ValueError:
                 pass
+    return entries
 
-    for m in matches:
-        past_jobs.append(
-            {
-                "date": timestamp,
-                "company": m.get("company", "N/A"),
-                "role": m.get("role", "N/A"),
-                "refnr": m.get("refnr", "N/A"),
-            }
-        )
+
+def _write_past_jobs(entries: List[Dict[str, Any]], file_path: str) -> None:
+    """Atomically rewrite the full suggestions record (used by cleanup only)."""
+    directory = os.path.dirname(file_path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.writelines(json_dumps(entry) + "\n" for entry in entries)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def cleanup_inactive_jobs(
+    file_path: str, projection: tuple = ()
+) -> List[Dict[str, Any]]:
+    """Verify which past job suggestions are still active and remove inactive ones from the local record.
+
+    With a projection, the returned entries carry only the named keys so
+    callers building LLM context don't have to re-project the full
+    records; the on-disk record always keeps the complete entries.
+    """
+    past_jobs = _load_past_jobs(file_path)
+    if not past_jobs:
+        return []
+
+    logger.info("Verifying %d past suggestions for availability...", len(past_jobs))
+    _load_activity_cache()
+
+    active_map = _check_jobs_active(
+        [job.get("refnr") for job in past_jobs if job.get("refnr")]
+    )
+    active_jobs = [
+        job for job in past_jobs if active_map.get(job.get("refnr"), False)
+    ]
+
+    _save_activity_cache()
+    logger.info(
+        "Kept %d active past jobs, removed %d.",
+        len(active_jobs),
+        len(past_jobs) - len(active_jobs),
+    )
+
+    _write_past_jobs(active_jobs, file_path)
+
+    if projection:
+        return [{key: job.get(key) for key in projection} for job in active_jobs]
+    return active_jobs
+
+def save_suggested_jobs(matches: List[Dict[str, Any]], file_path: str):
+    """Append new job matches to the historical suggestions record.
+
+    With the JSON Lines format this is O(appended) - existing history is
+    never re-read or re-serialized.
+    """
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
 
     os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(past_jobs, f, indent=2, ensure_ascii=False)
+    with open(file_path, "a", encoding="utf-8") as f:
+        f.writelines(
+            json_dumps(
+                {
+                    "date": timestamp,
+                    "company": m.get("company", "N/A"),
+                    "role": m.get("role", "N/A"),
+                    "refnr": m.get("refnr", "N/A"),
+                }
+            )
+            + "\n"
+            for m in matches
+        )
@@ -1,50 +1,99 @@
 #!/usr/bin/env python3
+import hashlib
+import importlib.util
 import os
-import webbrowser
+import subprocess
+import sys
 from pathlib import Path
 
-try:
-    from report_generator import generate_html
-except ImportError:
-    import sys
-    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from report_generator import generate_html
+
+def _load_sibling(name: str):
+    """Load a sibling scripts/ module straight from its file.
+
+    Avoids the old try-import/sys.path.append dance: no import-cache
+    invalidation, no path pollution, and the same module regardless of
+    the invocation cwd. An already-imported module is reused.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(
+        name, Path(__file__).with_name(f"{name}.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_report_generator = _load_sibling("report_generator")
+Job = _report_generator.Job
+generate_html_to_file = _report_generator.generate_html_to_file
+json_loads = _load_sibling("jsonutil").json_loads
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+TEMPLATE_PATH = SCRIPT_DIR / "report_template.html"
+PREVIEW_PATH = SCRIPT_DIR / "preview.html"
+DUMMY_JOBS_PATH = SCRIPT_DIR / "dummy_jobs.json"
+
+# Dummy jobs for the preview, kept as JSON so cold imports skip parsing
+# a large Python literal and the fixture stays editable without touching
+# code. Built once at import as frozen Job records.
+_DUMMY_JOBS = tuple(
+    Job(**entry) for entry in json_loads(DUMMY_JOBS_PATH.read_bytes())
+)
+
+
+def _content_hash(path: Path) -> bytes:
+    """Short blake2b digest of a file's bytes, for change detection."""
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).digest()
+
 
 def generate_preview():
     """Generate an HTML preview using dummy job data and open it in the default browser."""
-    # Dummy jobs
-    dummy_jobs = [
-        {
-            "title": "Sachbearbeiter*in (w/m/d) IT-Verfahrensbetreuung Wahldatenbank und Fachverfahren",
-            "employer": "Amt für Statistik Berlin-Brandenburg",
-            "location": "Berlin",
-            "reason": "Sehr passgenau zu deinem Datenlabor-/Prototyping-Kontext im öffentlichen Dienst: Du betreust und entwickelst eine interne Wahldatenbank samt Schnittstellen/Tools weiter, bereitest Daten auf, testest Funktionalitäten und baust Import/Export-Prozesse (XML/CSV) sowie Skripte für Systemkommunikation. Tech-Stack ist modern und stark Open-Source-fähig (u.a. PostgreSQL/MySQL/MariaDB möglich, Linux, Git, Python/R/JS optional). Rolle ist fachlich-technisch, nicht Beratung, nicht Forschung, und ausdrücklich unbefristet in Berlin.",
-            "detail_url": "https://www.arbeitsagentur.de/jobsuche/",
-        },
-        {
-            "title": "IT-Systemadministrator/in (m/w/d) Archivsystem",
-            "employer": "DRV Berlin-Brandenburg",
-            "location": "Berlin (oder Frankfurt (Oder))",
-            "reason": "Öffentlicher Dienst, unbefristet, Standort Berlin möglich und stark technisch/hands-on: Linux-Server, Betrieb/Monitoring einer digitalen Archivlösung, Systemanalysen, Automatisierung/DevOps-Ansätze und 2nd-Level-Support. Passt gut, wenn du dich technisch weiterentwickeln willst (Linux, Monitoring, Automatisierung). Kein Beratungsfokus, keine Forschung.",
-            "detail_url": "https://www.arbeitsagentur.de/jobsuche/",
-        },
-    ]
-
-    # Read the HTML Template
-    template_path = Path(os.path.join(os.path.dirname(__file__), "report_template.html"))
-    html_content = generate_html(dummy_jobs, template_path)
-
-    # Save to preview.html
-    preview_path = os.path.join(os.path.dirname(__file__), "preview.html")
-    with open(preview_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
-
-    print(f"Generated preview at: {preview_path}")
-
-    # Try to open in browser automatically
+    # Stream the rendered template to a sibling tempfile, then rename it
+    # into place so a browser refresh never sees a half-written file.
+    tmp_path = PREVIEW_PATH.with_suffix(".html.tmp")
+    generate_html_to_file(list(_DUMMY_JOBS), TEMPLATE_PATH, tmp_path)
+
+    # In the edit/preview inner loop the output is often byte-identical
+    # to the last run; hashing both files is far cheaper than rewriting
+    # the preview and bouncing the browser tab for no visible change.
+    if PREVIEW_PATH.exists() and _content_hash(tmp_path) == _content_hash(PREVIEW_PATH):
+        tmp_path.unlink()
+        print(f"Preview unchanged at: {PREVIEW_PATH}")
+        return
+
+    os.replace(tmp_path, PREVIEW_PATH)
+
+    print(f"Generated preview at: {PREVIEW_PATH}")
+
+    _open_in_browser(PREVIEW_PATH)
+
+
+def _open_in_browser(path: Path) -> None:
+    """Open the preview in the default browser, fire-and-forget.
+
+    Skipped entirely for CI/headless runs that only regenerate the HTML.
+    On Linux/macOS the system opener is spawned without waiting, so the
+    script returns immediately; elsewhere webbrowser is the fallback.
+    """
+    if os.environ.get("CI") or not sys.stdout.isatty():
+        return
+
+    opener = {"linux": "xdg-open", "darwin": "open"}.get(sys.platform)
     try:
-        file_url = f"file://{os.path.abspath(preview_path)}"
-        webbrowser.open(file_url)
+        if opener:
+            subprocess.Popen(
+                [opener, str(path)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        else:
+            # Imported lazily: most runs never reach this fallback, and the
+            # module's platform probing is not free at startup.
+            import webbrowser
+
+            webbrowser.open(f"file://{path}")
         print("Opened preview in your default browser.")
     except Exception as e:
         print(f"Could not open browser automatically: {e}")
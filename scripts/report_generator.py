@@ -1,9 +1,208 @@
-from typing import List, Dict, Any
+import functools
+import os
+import sys
+import tempfile
+from dataclasses import dataclass
+from html import escape
+from typing import List, Dict, Any, Tuple
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import (
+    BaseLoader,
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+    Template,
+    select_autoescape,
+)
 
-def generate_html(jobs: List[Dict[str, Any]], template_path: Path, total_cost: float = 0.0) -> str:
-    """Render the HTML report using Jinja2."""
-    env = Environment(loader=FileSystemLoader(template_path.parent))
-    template = env.get_template(template_path.name)
-    return template.render(job_count=len(jobs), jobs=jobs, total_cost=total_cost)
+# Compiled template bytecode persisted across processes, so cron/CLI runs
+# skip the parse/compile step after the first invocation.
+_BYTECODE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "jobsuche_jinja_cache")
+
+
+def make_environment(loader: BaseLoader) -> Environment:
+    """Build a Jinja2 environment with this project's rendering flags.
+
+    The single place the flags live: build_templates.py compiles through
+    this same constructor, so output rendered from compiled_templates.zip
+    is byte-identical to output rendered from template source.
+
+    auto_reload=False skips the per-render stat() of the template file;
+    templates here only change with the code. cache_size=-1 keeps every
+    compiled template resident for the process lifetime (no LRU
+    eviction), so repeated get_template calls are free.
+    """
+    os.makedirs(_BYTECODE_CACHE_DIR, exist_ok=True)
+    return Environment(
+        loader=loader,
+        autoescape=select_autoescape(["html", "htm"]),
+        auto_reload=False,
+        cache_size=-1,
+        optimized=True,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=FileSystemBytecodeCache(directory=_BYTECODE_CACHE_DIR),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_env(parent: str) -> Environment:
+    """Build (once per template directory) the shared Jinja2 environment.
+
+    If build_templates.py has produced compiled_templates.zip, templates
+    come straight from the precompiled module and never touch the
+    lexer/parser.
+    """
+    loader: BaseLoader = FileSystemLoader(parent)
+    compiled_zip = os.path.join(parent, "compiled_templates.zip")
+    if os.path.exists(compiled_zip):
+        loader = ChoiceLoader([ModuleLoader(compiled_zip), loader])
+    return make_environment(loader)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_template(path_str: str) -> Template:
+    """Return the compiled Template for an absolute path, compiled once.
+
+    Caching the Template itself skips even the loader dispatch and cache
+    lookup inside get_template on the render path.
+    """
+    path = Path(path_str)
+    return _get_env(str(path.parent)).get_template(path.name)
+
+
+@dataclass(slots=True, frozen=True)
+class Job:
+    """One report entry.
+
+    Slots make Jinja's job.title lookups hit a descriptor instead of a
+    dict and cut per-entry memory; frozen keeps render input immutable.
+    """
+
+    title: str
+    employer: str
+    location: str
+    reason: str
+    detail_url: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Job":
+        # Employers and locations repeat heavily across entries; interning
+        # collapses the duplicates to one object each, so downstream
+        # dict/set operations compare by pointer.
+        return cls(
+            title=data.get("title", ""),
+            employer=sys.intern(data.get("employer", "")),
+            location=sys.intern(data.get("location", "")),
+            reason=data.get("reason", ""),
+            detail_url=data.get("detail_url", ""),
+        )
+
+
+# Markers the fast path splits the template source on. They mirror the
+# template's actual structure; if the template diverges, the fast path
+# fails its split and rendering falls back to Jinja.
+_FOR_START = "{% for job in jobs %}"
+_FOR_END = "{% endfor %}"
+_COST_START = "{% if total_cost is defined and total_cost > 0 %}"
+_COST_END = "{% endif %}"
+_JOB_FIELDS = ("detail_url", "title", "employer", "location", "reason")
+
+
+@functools.lru_cache(maxsize=16)
+def _get_fast_parts(path_str: str) -> Tuple[str, str, str, str, str]:
+    """Partially evaluate the template source into static segments.
+
+    Done once per template: everything outside the job loop and the cost
+    conditional is fixed text, so per-render work reduces to escaping and
+    substituting the five job fields.
+    """
+    src = Path(path_str).read_text(encoding="utf-8")
+    head, rest = src.split(_FOR_START, 1)
+    job_block, tail = rest.split(_FOR_END, 1)
+    cost_pre, rest = tail.split(_COST_START, 1)
+    cost_block, cost_post = rest.split(_COST_END, 1)
+    return head, job_block, cost_pre, cost_block, cost_post
+
+
+def _render_fast(jobs: List[Job], path_str: str, total_cost: float) -> str:
+    """Specialized renderer bypassing the Jinja interpreter loop.
+
+    Output is semantically equivalent to the Jinja path, not
+    byte-identical: html.escape picks different entity spellings than
+    markupsafe (&#x27; vs &#39;), and trim_blocks/lstrip_blocks are not
+    emulated, so whitespace differs. Don't compare the two renders
+    byte-for-byte (e.g. in a content-hash gate).
+    """
+    head, job_block, cost_pre, cost_block, cost_post = _get_fast_parts(path_str)
+    e = escape
+    parts = [head.replace("{{ jobs|length }}", str(len(jobs)))]
+    append = parts.append
+    for job in jobs:
+        block = job_block
+        for field in _JOB_FIELDS:
+            value = job.get(field, "") if isinstance(job, dict) else getattr(job, field, "")
+            block = block.replace("{{ job.%s }}" % field, e(str(value), quote=True))
+        append(block)
+    append(cost_pre)
+    if total_cost > 0:
+        append(
+            cost_block.replace('{{ "%.4f"|format(total_cost) }}', f"{total_cost:.4f}")
+        )
+    append(cost_post)
+    return "".join(parts)
+
+
+def load_template(template_path: Path) -> Template:
+    """Load and compile a template once, for callers that render repeatedly.
+
+    The returned Template comes from the shared cached Environment, so a
+    loop over many job sets (per-variant previews, batch sends) pays the
+    compile cost a single time and then only renders.
+    """
+    return _get_template(str(template_path))
+
+
+def render_jobs(template: Template, jobs: List[Job], total_cost: float = 0.0) -> str:
+    """Render one job set against an already-loaded Template."""
+    return template.render(jobs=jobs, total_cost=total_cost)
+
+
+def generate_html(jobs: List[Job], template_path: Path, total_cost: float = 0.0) -> str:
+    """Render the HTML report using Jinja2.
+
+    Autoescaping is on: job titles, employer names, and LLM-written reasons
+    are untrusted text and must not inject markup into the report.
+
+    With REPORT_FAST=1 a hand-specialized renderer substitutes the job
+    fields into pre-split template segments instead of running the Jinja
+    interpreter; any mismatch with the template structure falls back to
+    the normal path.
+    """
+    if os.getenv("REPORT_FAST") == "1":
+        try:
+            return _render_fast(jobs, str(template_path), total_cost)
+        except ValueError:
+            pass
+    # The template derives the count via jobs|length itself.
+    return render_jobs(load_template(template_path), jobs, total_cost=total_cost)
+
+
+def generate_html_to_file(
+    jobs: List[Job],
+    template_path: Path,
+    out_path: Path,
+    total_cost: float = 0.0,
+) -> None:
+    """Render the HTML report straight to a file.
+
+    Streams template chunks to disk instead of materializing the whole
+    document as one string first - peak memory stays flat however many
+    jobs the report carries.
+    """
+    template = _get_template(str(template_path))
+    template.stream(jobs=jobs, total_cost=total_cost).dump(
+        str(out_path), encoding="utf-8"
+    )